@@ -2,17 +2,24 @@
 # -*- coding: utf-8 -*-
 """
 Purdue MBB collector: news + On3 fan board
+- Reads every source from static/sources.json
 - Pulls multiple sources, filters to Purdue MBB, dedupes, sorts desc, writes items.json
 - Scrapes On3 Free Board (HTML), normalizes relative dates, writes board.json
 """
 
-import os, re, json, time, math, html, hashlib
+import os, io, re, json, calendar, math, html, hashlib, functools, heapq
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from urllib.parse import urlparse, urljoin
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve as sv
 
 ROOT = os.path.dirname(os.path.abspath(__file__))
 SITE_ROOT = os.path.normpath(os.path.join(ROOT, ".."))
@@ -22,57 +29,234 @@ os.makedirs(OUT_DIR, exist_ok=True)
 
 TZ = timezone(timedelta(hours=-5))  # ET fallback; timestamps stay ISO with Z
 
+MAX_ITEMS_PER_FEED = 50  # how deep we read into each feed
+MAX_AGE_HOURS = 96  # rolling window (last ~4 days)
+MAX_BODY_BYTES = 5_000_000  # real feeds/pages are well under this
+ATOM = "{http://www.w3.org/2005/Atom}"
+MEDIA = "{http://search.yahoo.com/mrss/}"
+CONTENT = "{http://purl.org/rss/1.0/modules/content/}"
+DC = "{http://purl.org/dc/elements/1.1/}"
+
+# RFC-822 shape nearly every RSS pubDate uses; tried before the generic parser
+_FAST_FMT = "%a, %d %b %Y %H:%M:%S %z"
+
+# -------------------------
+# HTTP
+# -------------------------
+# One pooled keep-alive session for every fetch, so feeds on the same host
+# (ESPN, On3, ...) reuse their TCP/TLS connection instead of reconnecting.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+# a couple of quick retries on connect/read hiccups rather than losing the feed this run
+ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                      max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount("https://", ADAPTER)
+SESSION.mount("http://", ADAPTER)
+
+def http_get(url, cached=None):
+    """
+    GET over SESSION, streaming the body so a runaway feed or page can't
+    balloon memory: past MAX_BODY_BYTES it raises ValueError rather than
+    hand a cut-off document to the parsers. Returns (response, body).
+    With a feed-cache entry, send its validators as a conditional GET and
+    return None on 304 Not Modified.
+    """
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    with SESSION.get(url, timeout=20, headers=headers, stream=True) as res:
+        if res.status_code == 304:
+            return None
+        res.raise_for_status()
+        too_big = ValueError(f"body over {MAX_BODY_BYTES} bytes, skipped")
+        if int(res.headers.get("Content-Length") or 0) > MAX_BODY_BYTES:
+            raise too_big
+        chunks, size = [], 0
+        for chunk in res.iter_content(64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise too_big
+    return res, b"".join(chunks)
+
+def parse_feed(res, body):
+    """Hand a fetched feed's bytes to feedparser."""
+    return feedparser.parse(body, response_headers={
+        "content-type": res.headers.get("Content-Type", ""),
+        "content-location": res.url,
+    })
+
+# item/entry child tag -> field, RSS and Atom spellings side by side
+ENTRY_TAGS = ("item", ATOM + "entry")
+ENTRY_FIELDS = {
+    "title": "title", ATOM + "title": "title",
+    "link": "link",
+    "guid": "id", ATOM + "id": "id",
+    "description": "summary", ATOM + "summary": "summary",
+    ATOM + "content": "content", CONTENT + "encoded": "content",
+    MEDIA + "description": "media",
+    "pubDate": "published", ATOM + "published": "published", ATOM + "updated": "updated",
+    DC + "date": "updated",  # feedparser maps dc:date to updated too
+}
+
+def read_entry(elem):
+    """Walk an <item>/<entry>'s children once, dispatching on tag (first value wins)."""
+    kv = {}
+    for child in elem:
+        if child.tag == ATOM + "link":
+            if "link" not in kv and child.get("rel", "alternate") == "alternate":
+                kv["link"] = child.get("href", "")
+            continue
+        if child.tag == MEDIA + "group":
+            # YouTube nests the video description one level down
+            desc = child.find(MEDIA + "description")
+            if desc is not None and "media" not in kv:
+                kv["media"] = desc.text or ""
+            continue
+        field = ENTRY_FIELDS.get(child.tag)
+        if field and field not in kv:
+            kv[field] = child.text or ""
+    return {
+        "title": kv.get("title", ""),
+        "link": kv.get("link") or kv.get("id", ""),
+        "summary": kv.get("summary") or kv.get("content") or kv.get("media", ""),
+        "published": kv.get("published") or kv.get("updated", ""),
+    }
+
+def parse_feed_xml(body, limit=MAX_ITEMS_PER_FEED):
+    """
+    Stream RSS <item> / Atom <entry> elements with iterparse, freeing each
+    one once read and stopping after `limit`, instead of building the whole
+    feed in memory. Returns plain dicts shaped like feedparser entries
+    (title/link/summary/published). Raises ET.ParseError on malformed XML.
+    """
+    entries = []
+    for _, elem in ET.iterparse(io.BytesIO(body), events=("end",)):
+        if elem.tag not in ENTRY_TAGS:
+            continue
+        entries.append(read_entry(elem))
+        elem.clear()
+        if len(entries) >= limit:
+            break
+    return entries
+
+def feed_entries(res, body):
+    """Entries of a fetched feed: the streaming parser, or feedparser if it can't cope."""
+    head = body[:512].lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    # empty body, not markup, or an HTML error page: nothing for either parser
+    if not head.startswith(b"<") or b"<html" in head[:200]:
+        return []
+    try:
+        entries = parse_feed_xml(body)
+    except ET.ParseError:
+        entries = []
+    # an undated entry would be stamped `now` and float to the top: if the fast
+    # path found no date field somewhere, let feedparser read the whole feed
+    if entries and all(e["published"] for e in entries):
+        return entries
+    return parse_feed(res, body).entries[:MAX_ITEMS_PER_FEED]
+
+# CSS selectors, compiled once at import
+SEL_LINKS = sv.compile("a[href]")
+SEL_FORUM_TITLE = sv.compile("h1.p-title-value")
+SEL_THREADS = sv.compile("div.structItem--thread")
+
+# -------------------------
+# Feed cache (ETag / Last-Modified, body hash + parsed items per URL, kept between runs)
+# -------------------------
+FEED_CACHE_PATH = os.path.join(ROOT, ".feed_cache.json")
+# Cached items were filtered and shaped by the rules of the run that stored
+# them. Bump this whenever the relevance filter or item fields change, so
+# entries from older rules are refetched and re-parsed instead of reused.
+FILTER_VERSION = 2
+
+def load_feed_cache():
+    try:
+        with open(FEED_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+def write_json(path, data):
+    """Write through a temp file + os.replace so readers never see a half-written file."""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        # make the bytes durable before the rename publishes them
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
 # -------------------------
 # Utilities
 # -------------------------
-def now_iso():
-    return datetime.now(timezone.utc).isoformat()
+# feed summaries often carry markup; a regex strip is plenty for one-line text
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
 
 def decode(s: str) -> str:
-    return html.unescape((s or "").strip())
+    s = s or ""
+    # strip real tags before unescaping, so an escaped "&lt;" stays literal text
+    if "<" in s:
+        s = _TAG_RE.sub(" ", s)
+    return _WS_RE.sub(" ", html.unescape(s)).strip()
 
 def sha(s: str) -> str:
-    return hashlib.sha1(s.encode("utf-8")).hexdigest()[:12]
+    # 6-byte BLAKE2b -> same 12 hex chars as before, without hashing a full SHA-1
+    return hashlib.blake2b(s.encode("utf-8"), digest_size=6).hexdigest()
+
+def iso_z(dt) -> str:
+    """UTC 'YYYY-MM-DDTHH:MM:SSZ': one fixed width, so date strings sort chronologically."""
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
+# each item's URL is canonicalized for its id and again for dedupe
+@functools.lru_cache(maxsize=4096)
 def canonical_url(u: str) -> str:
+    if not u:
+        return ""
     try:
         p = urlparse(u)
-        # drop tracking params
-        return f"{p.scheme}://{p.netloc}{p.path}".rstrip("/")
+        # drop tracking params; host is case-insensitive
+        return f"{p.scheme}://{p.netloc.lower()}{p.path}".rstrip("/")
     except Exception:
         return u
 
-def parse_datetime_guess(entry):
+def parse_datetime_guess(entry, now=None):
     """
     Robust date resolver: feed published/parsing + relative phrases.
-    Returns aware UTC datetime.
+    Returns aware UTC datetime; `now` is the run's clock, reused for fallbacks.
     """
-    # 1) feed fields
-    for key in ("published_parsed", "updated_parsed"):
-        dt = getattr(entry, key, None)
-        if dt:
-            return datetime.fromtimestamp(time.mktime(dt), timezone.utc)
-    # 2) dict access
-    for key in ("published_parsed", "updated_parsed"):
-        dt = entry.get(key)
-        if dt:
-            return datetime.fromtimestamp(time.mktime(dt), timezone.utc)
-    # 3) text fields
+    # 1) feed fields (feedparser's *_parsed are UTC struct_times: timegm, not local mktime);
+    #    one .get each covers FeedParserDict and the iterparse dicts alike
+    dt = entry.get("published_parsed") or entry.get("updated_parsed")
+    if dt:
+        return datetime.fromtimestamp(calendar.timegm(dt), timezone.utc)
+    # 2) text fields
     txt = (entry.get("published") or entry.get("updated") or entry.get("date") or "").strip()
     if txt:
-        # try multiple known patterns
-        for fmt in (
-            "%a, %d %b %Y %H:%M:%S %Z",
-            "%a, %d %b %Y %H:%M:%S %z",
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%b %d, %Y",
-            "%b %d %Y",
-            "%Y-%m-%d %H:%M:%S",
-        ):
+        # fast path: numeric-offset RFC-822 pubDate
+        try:
+            return datetime.strptime(txt, _FAST_FMT).astimezone(timezone.utc)
+        except ValueError:
+            pass
+        # generic RFC-822 (named zones like GMT/EST)
+        try:
+            return parsedate_to_datetime(txt).astimezone(timezone.utc)
+        except (TypeError, ValueError):
+            pass
+        # ISO-8601 (Atom, most JSON-ish sources) in one C-level call
+        try:
+            return datetime.fromisoformat(txt.replace("Z", "+00:00")).astimezone(timezone.utc)
+        except ValueError:
+            pass
+        # month-name dates some pages print
+        for fmt in ("%b %d, %Y", "%b %d %Y"):
             try:
                 return datetime.strptime(txt, fmt).astimezone(timezone.utc)
-            except Exception:
+            except ValueError:
                 pass
         # relative e.g. "9 hours ago"
         rel = txt.lower()
@@ -80,7 +264,7 @@ def parse_datetime_guess(entry):
         if m:
             n = int(m.group(1))
             unit = m.group(2)
-            dt = datetime.now(timezone.utc)
+            dt = now or datetime.now(timezone.utc)
             if unit.startswith("minute"):
                 dt -= timedelta(minutes=n)
             elif unit.startswith("hour"):
@@ -103,125 +287,240 @@ def parse_datetime_guess(entry):
                 return datetime(yy, int(mm), int(dd), tzinfo=timezone.utc)
             except Exception:
                 pass
-    # 4) fallback: now
-    return datetime.now(timezone.utc)
+    # 3) fallback: now
+    return now or datetime.now(timezone.utc)
 
-def looks_purdue(text):
-    t = (text or "").lower()
-    return any(k in t for k in (
-        "purdue", "boilermaker", "matt painter", "mackey", "west lafayette",
-        "boilermakers", "trey kaufman", "zach edey", "braden smith", "mason gillis"
-    ))
+PURDUE_KEYWORDS = (
+    "purdue", "boilermaker", "matt painter", "mackey", "west lafayette",
+    "boilermakers", "trey kaufman", "zach edey", "braden smith", "mason gillis"
+)
+
+# Purdue stories that aren't men's hoops; football dominates the athletics
+# PR feeds, so it goes first
+REJECT_TERMS = (
+    "football", "baseball", "volleyball", "softball", "soccer", "wrestling",
+    "women's basketball", "women’s basketball", "wbb",
+    "nil deal", "weekly awards",  # lots of generic dept PR
+)
+
+# must also be about hoops, not just any Purdue mention (track, admissions, ...)
+HOOPS_TERMS = (
+    "basketball", "men's basketball", "men’s basketball", "mbb",
+    "big ten", "big ten basketball", "ncaa basketball",
+    "guard", "forward", "center", "point guard", "shooting guard",
+    "recruiting", "commit", "exhibition",
+    "painter", "matt painter",  # Matt Painter
+)
+
+def alternation(terms) -> str:
+    # longest first, so "women's basketball" wins over any shorter overlap
+    return "|".join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+
+@functools.cache
+def term_re():
+    """
+    REJECT_TERMS, PURDUE_KEYWORDS and HOOPS_TERMS in one alternation with a
+    named group per category, compiled once per process on first use, so a
+    text is scanned once and m.lastgroup names the category.
+    """
+    return re.compile(
+        f"(?P<reject>{alternation(REJECT_TERMS)})"
+        f"|(?P<purdue>{alternation(PURDUE_KEYWORDS)})"
+        f"|(?P<hoops>{alternation(HOOPS_TERMS)})",
+        re.I,
+    )
+
+def looks_purdue_mbb(*texts, national=False, hoops=False):
+    """
+    Purdue men's hoops: no reject term anywhere in `texts`, a hoops term, and
+    a Purdue keyword. Sources flagged `national` (general college hoops
+    outlets) keep hoops stories without a Purdue mention; `hoops` means the
+    source itself is men's basketball only, so no hoops term is needed.
+    """
+    found = set()
+    for text in texts:
+        # re.I matches case-insensitively in C; no lowercased copy of the text
+        for m in term_re().finditer(text or ""):
+            if m.lastgroup == "reject":
+                return False
+            found.add(m.lastgroup)
+    if not (hoops or "hoops" in found):
+        return False
+    return national or "purdue" in found
 
 def to_item(source, title, url, summary, dt):
+    """`title`/`summary` arrive as plain text (decode()d by the caller, which matched on it)."""
     return {
         "id": sha(canonical_url(url) + title),
         "source": source,
-        "title": decode(title)[:280],
+        "title": title[:280],
         "url": url,
-        "summary": decode(summary)[:400],
-        "date": dt.astimezone(timezone.utc).isoformat(),
+        "summary": summary[:400],
+        "date": iso_z(dt),
     }
 
 # -------------------------
 # News feeds
 # -------------------------
+# One source list for the whole collector: static/sources.json. Each entry is
+# {"name", "url", "type"} with type "rss" (RSS/Atom), "html" (headline scrape
+# of a team page) or "board" (the On3 forum, see collect_board), plus
+# "national": true for general college hoops outlets (see looks_purdue_mbb).
+SOURCES_PATH = os.path.join(SITE_ROOT, "static", "sources.json")
+
+def load_sources():
+    with open(SOURCES_PATH, encoding="utf-8") as f:
+        return json.load(f)["feeds"]
+
+SOURCES = load_sources()
 FEEDS = [
-    # Purdue official
-    ("Purdue Athletics MBB", "https://purduesports.com/rss?path=mbball"),
-    # Yahoo college basketball (broad; will be filtered)
-    ("Yahoo Sports College Basketball", "https://www.yahoo.com/news/rss/college-basketball"),
-    # ESPN Purdue team news
-    ("ESPN Purdue MBB", "https://www.espn.com/college-basketball/team/_/id/2509/purdue-boilermakers"),
-    # CBS college basketball (broad; filtered)
-    ("CBS Sports College Basketball", "https://www.cbssports.com/rss/headlines/college-basketball/"),
-    # SI Purdue (has Purdue tag page RSS)
-    ("Sports Illustrated — Purdue", "https://www.si.com/college/purdue/.rss"),
-    # The Field of 68 (broad articles; filtered)
-    ("The Field of 68", "https://www.youtube.com/feeds/videos.xml?channel_id=UCtgu-ouR3de2Ww5QQB6W4_Q"),
+    (s["name"], s["url"], s.get("type", "rss"), s.get("national", False))
+    for s in SOURCES if s.get("type") != "board"
 ]
 
-def fetch_feed(name, url):
+# circuit breaker: after this many failed runs in a row a source is backed off
+# (30 min, doubling, capped) instead of costing a timeout every run
+FAIL_THRESHOLD = 3
+MAX_BACKOFF = timedelta(hours=12)
+
+def note_failure(cache, url, now):
+    """Count a failed fetch in the feed cache; from FAIL_THRESHOLD on, set retry_after."""
+    entry = dict(cache.get(url) or {})
+    n = entry.get("failures", 0) + 1
+    entry["failures"] = n
+    if n >= FAIL_THRESHOLD:
+        wait = timedelta(minutes=30) * 2 ** min(n - FAIL_THRESHOLD, 5)
+        entry["retry_after"] = iso_z(now + min(wait, MAX_BACKOFF))
+    cache[url] = entry
+
+def fetch_feed(name, url, kind, national, now, cache):
+    cached = cache.get(url)
+    cutoff = now - timedelta(hours=MAX_AGE_HOURS)
     items = []
+    if cached and cached.get("retry_after", "") > iso_z(now):
+        print(f"[feed-skip] {name}: {cached['failures']} failed runs, retry after {cached['retry_after']}")
+        return items
+    if cached and cached.get("filter") != FILTER_VERSION:
+        # parsed under older rules: no validators, no body-hash reuse this time
+        cached = None
     try:
-        if url.endswith(".xml") or url.endswith(".rss") or "/rss" in url or "feeds" in url or "rss?" in url:
-            d = feedparser.parse(url)
-            for e in d.entries[:50]:
+        got = http_get(url, cached)
+        if got is None:
+            # 304: unchanged since last run, reuse what we parsed then
+            cached.pop("failures", None)
+            cached.pop("retry_after", None)
+            return cached["items"]
+        res, body = got
+        body_hash = hashlib.blake2b(body, digest_size=8).hexdigest()
+        if cached and cached.get("body_hash") == body_hash:
+            # no validators honored, but byte-identical to last run: skip parsing
+            items = cached["items"]
+        elif kind == "html":
+            # Basic HTML scrape of a team page (ESPN)
+            soup = BeautifulSoup(body, "lxml")
+            # grab headline cards that mention Purdue; lazily, stopping once
+            # we have as many as the final list can hold
+            # one item per article: nav, card and "read more" links share an href
+            seen = set()
+            for a in SEL_LINKS.iselect(soup):
+                href = a.get("href","").split("#", 1)[0].strip()
+                if not href or href.lower().startswith(("javascript:", "mailto:")):
+                    continue
+                if href.startswith("/"):
+                    href = urljoin(url, href)
+                if href in seen:
+                    continue
+                # get_text is already unescaped: only fold whitespace, don't decode() again
+                text = _WS_RE.sub(" ", a.get_text(" ", strip=True) or "")
+                # a team page is men's hoops by construction
+                if not text or not looks_purdue_mbb(text, hoops=True):
+                    continue
+                seen.add(href)
+                items.append(to_item(name, text, href, "", now))
+                if len(items) >= 20:
+                    break
+        else:
+            for e in feed_entries(res, body):
                 link = e.get("link") or e.get("id") or ""
-                title = e.get("title") or ""
-                summary = e.get("summary") or e.get("description") or ""
-                dt = parse_datetime_guess(e)
+                title = decode(e.get("title"))
+                summary = decode(e.get("summary") or e.get("description"))
+                # relevance first, on the visible text (not hrefs/attributes in the
+                # markup): only Purdue items pay for date parsing + to_item
+                if not looks_purdue_mbb(title, summary, national=national):
+                    continue
+                dt = parse_datetime_guess(e, now)
+                if dt < cutoff:
+                    continue
                 items.append(to_item(name, title, link, summary, dt))
-        else:
-            # Basic HTML scrape for ESPN team page
-            if "espn.com/college-basketball/team" in url:
-                res = requests.get(url, timeout=20, headers={"User-Agent":"Mozilla/5.0"})
-                res.raise_for_status()
-                soup = BeautifulSoup(res.text, "html.parser")
-                # grab headline cards that mention Purdue
-                for a in soup.select("a[href]"):
-                    href = a.get("href","")
-                    text = (a.get_text(" ", strip=True) or "")
-                    if not href or not text: 
-                        continue
-                    if not looks_purdue(text):
-                        continue
-                    if href.startswith("/"):
-                        href = urljoin("https://www.espn.com", href)
-                    dt = datetime.now(timezone.utc)
-                    items.append(to_item("ESPN Purdue MBB", text, href, "", dt))
-            else:
-                # default try as feed
-                d = feedparser.parse(url)
-                for e in d.entries[:50]:
-                    link = e.get("link") or e.get("id") or ""
-                    title = e.get("title") or ""
-                    summary = e.get("summary") or e.get("description") or ""
-                    dt = parse_datetime_guess(e)
-                    items.append(to_item(name, title, link, summary, dt))
+        cache[url] = {
+            "etag": res.headers.get("ETag", ""),
+            "last_modified": res.headers.get("Last-Modified", ""),
+            "body_hash": body_hash,
+            "filter": FILTER_VERSION,
+            "items": items,
+        }
     except Exception as ex:
         print(f"[feed-error] {name}: {ex}")
+        note_failure(cache, url, now)
     return items
 
-def collect_news():
-    raw = []
-    for name, url in FEEDS:
-        raw.extend(fetch_feed(name, url))
-
-    # Filter to Purdue MBB
-    filtered = []
-    for it in raw:
-        text = f"{it['title']} {it['summary']}"
-        if looks_purdue(text):
-            filtered.append(it)
-
-    # Deduplicate by canonical URL or title
-    seen = set()
-    dedup = []
-    for it in filtered:
-        key = (canonical_url(it["url"]) or "") + "||" + it["title"].lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        dedup.append(it)
+# wire stories (AP etc.) reappear across outlets under different URLs
+_TITLE_KEY_RE = re.compile(r"[^a-z0-9]+")
 
-    # Sort desc by date
-    dedup.sort(key=lambda x: x["date"], reverse=True)
-    return dedup[:20]
+def title_key(title):
+    return _TITLE_KEY_RE.sub("", title.lower())[:80]
+
+def unique_items(futures):
+    """
+    Yield fetch_feed results in FEEDS order, skipping repeats: same canonical
+    URL, or same title once case, spaces and punctuation are dropped. The
+    earlier source in FEEDS wins. Blocks on each future in turn.
+    """
+    seen_urls, seen_titles = set(), set()
+    for fut in futures:
+        for it in fut.result():
+            url_key = canonical_url(it["url"])
+            tkey = title_key(it["title"])
+            if url_key in seen_urls or tkey in seen_titles:
+                continue
+            if url_key:
+                seen_urls.add(url_key)
+            if tkey:
+                seen_titles.add(tkey)
+            yield it
+
+def collect_news(now, cache):
+    if not FEEDS:
+        return []
+    # fetches are network-bound: run them side by side, keep FEEDS order
+    with ThreadPoolExecutor(max_workers=min(16, len(FEEDS))) as ex:
+        futures = [
+            ex.submit(fetch_feed, name, url, kind, national, now, cache)
+            for name, url, kind, national in FEEDS
+        ]
+        # fetch_feed already kept only fresh Purdue MBB items; items reused from
+        # the feed cache can have aged out of the window since, so check again
+        cutoff = iso_z(now - timedelta(hours=MAX_AGE_HOURS))
+        fresh = (it for it in unique_items(futures) if it["date"] >= cutoff)
+        # stream them through the dedupe into a 20-slot heap, no intermediate list.
+        # Futures are read in FEEDS order (that order decides which copy of a
+        # duplicate wins), so a feed's items wait for every feed listed before it.
+        return heapq.nlargest(20, fresh, key=lambda x: x["date"])
 
 # -------------------------
 # On3 board (Free Board – Purdue MBB)
 # -------------------------
-BOARD_URL = "https://www.on3.com/boards/forums/free-board-boilermaker-mens-basketball.160/"
+# None when sources.json has no board entry: main() then leaves board.json alone
+BOARD_URL = next((s["url"] for s in SOURCES if s.get("type") == "board"), None)
 
-def parse_relative_when(s: str) -> datetime:
+def parse_relative_when(s: str, now=None) -> datetime:
     s = (s or "").strip().lower()
     # patterns like "9 hours ago", "10 minutes ago"
     m = re.search(r"(\d+)\s+(minute|hour|day|week)s?\s+ago", s)
     if m:
         n = int(m.group(1))
         unit = m.group(2)
-        dt = datetime.now(timezone.utc)
+        dt = now or datetime.now(timezone.utc)
         if unit.startswith("minute"):
             dt -= timedelta(minutes=n)
         elif unit.startswith("hour"):
@@ -237,20 +536,46 @@ def parse_relative_when(s: str) -> datetime:
             return datetime.strptime(s, fmt).replace(tzinfo=timezone.utc)
         except Exception:
             pass
-    return datetime.now(timezone.utc)
+    return now or datetime.now(timezone.utc)
 
-def collect_board():
+# XenForo row pieces collect_board reads, keyed by (tag, class)
+ROW_PARTS = {
+    ("a", "structItem-title"): "title",
+    ("a", "PreviewTooltip"): "preview",
+    ("div", "structItem-minor"): "minor",
+    ("a", "username"): "author",
+}
+
+def row_parts(row):
+    """
+    Walk a thread row once and return {part: first matching element}
+    instead of one select_one() subtree scan per field.
+    """
+    found = {}
+    for el in row.find_all(True):
+        if el.name == "time":
+            found.setdefault("time", el)
+            continue
+        for cls in el.get("class") or ():
+            part = ROW_PARTS.get((el.name, cls))
+            if part:
+                found.setdefault(part, el)
+    return found
+
+def collect_board(now):
     out = []
     try:
-        res = requests.get(BOARD_URL, timeout=20, headers={"User-Agent":"Mozilla/5.0"})
-        res.raise_for_status()
-        soup = BeautifulSoup(res.text, "html.parser")
+        _, body = http_get(BOARD_URL)
+        soup = BeautifulSoup(body, "lxml")
+
+        # forum name is page-level: look it up once, not per row
+        forum = SEL_FORUM_TITLE.select_one(soup)
+        forum_name = forum.get_text(" ", strip=True) if forum else "On3 Free Board"
 
         # XenForo thread rows
-        for row in soup.select("div.structItem--thread")[:30]:
-            a = row.select_one("a.structItem-title")
-            if not a:
-                a = row.select_one("a.PreviewTooltip")
+        for row in SEL_THREADS.select(soup, limit=30):
+            parts = row_parts(row)
+            a = parts.get("title") or parts.get("preview")
             if not a:
                 continue
             title = decode(a.get_text(" ", strip=True))
@@ -258,22 +583,19 @@ def collect_board():
             if href.startswith("/"):
                 href = urljoin("https://www.on3.com", href)
 
-            # forum name & timestamp
-            forum = soup.select_one("h1.p-title-value")
-            forum_name = forum.get_text(" ", strip=True) if forum else "On3 Free Board"
-
+            # timestamp
             ts = ""
-            time_el = row.select_one("time")
+            time_el = parts.get("time")
             if time_el and time_el.get("datetime"):
                 ts = time_el.get("datetime")
-                dt = parse_datetime_guess({"published": ts})
+                dt = parse_datetime_guess({"published": ts}, now)
             else:
-                sub = row.select_one("div.structItem-minor")
+                sub = parts.get("minor")
                 ts_text = sub.get_text(" ", strip=True) if sub else ""
-                dt = parse_relative_when(ts_text)
+                dt = parse_relative_when(ts_text, now)
 
             # author
-            author_el = row.select_one("a.username")
+            author_el = parts.get("author")
             author = author_el.get_text(strip=True) if author_el else ""
 
             out.append({
@@ -282,42 +604,53 @@ def collect_board():
                 "title": title,
                 "url": href,
                 "author": author,
-                "date": dt.astimezone(timezone.utc).isoformat()
+                "date": iso_z(dt)
             })
     except Exception as ex:
         print(f"[board-error] {ex}")
-    # Sort desc newest
-    out.sort(key=lambda x: x["date"], reverse=True)
-    return out[:20]
+    # Newest 20
+    return heapq.nlargest(20, out, key=lambda x: x["date"])
 
 # -------------------------
 # Main
 # -------------------------
 def main():
-    news = collect_news()
-    board = collect_board()
+    # one clock per run: undated items and both "updated" stamps share it
+    now = datetime.now(timezone.utc)
+    updated = now.isoformat()
+
+    cache = load_feed_cache()
+    # the board page shares nothing with the feeds: fetch it alongside them
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        board_fut = ex.submit(collect_board, now) if BOARD_URL else None
+        news = collect_news(now, cache)
+        board = board_fut.result() if board_fut else None
+
+    # keep validators only for feeds still configured
+    write_json(FEED_CACHE_PATH, {url: cache[url] for _, url, *_ in FEEDS if url in cache})
 
     # Write news
     items_path = os.path.join(OUT_DIR, "items.json")
-    with open(items_path, "w", encoding="utf-8") as f:
-        json.dump({
-            "team": TEAM_SLUG,
-            "updated": now_iso(),
-            "count": len(news),
-            "items": news
-        }, f, ensure_ascii=False, indent=2)
+    write_json(items_path, {
+        "team": TEAM_SLUG,
+        "updated": updated,
+        "count": len(news),
+        "items": news
+    })
+
+    print(f"Wrote {len(news)} news items → {items_path}")
 
     # Write board
+    if board is None:
+        print("No board source configured; board.json left as is")
+        return
     board_path = os.path.join(OUT_DIR, "board.json")
-    with open(board_path, "w", encoding="utf-8") as f:
-        json.dump({
-            "team": TEAM_SLUG,
-            "updated": now_iso(),
-            "count": len(board),
-            "threads": board
-        }, f, ensure_ascii=False, indent=2)
-
-    print(f"Wrote {len(news)} news items → {items_path}")
+    write_json(board_path, {
+        "team": TEAM_SLUG,
+        "updated": updated,
+        "count": len(board),
+        "threads": board
+    })
     print(f"Wrote {len(board)} board threads → {board_path}")
 
 if __name__ == "__main__":